@@ -40,46 +40,61 @@ def check_data_freshness():
 
 
 def main():
-    print("\n" + "=" * 60)
-    print("NVR DATA QUALITY REPORT")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print("=" * 60 + "\n")
+    # Build the whole report in memory and emit it with one write, instead
+    # of a syscall (and stdout lock) per print
+    parts = []
+    parts.append("\n" + "=" * 60)
+    parts.append("NVR DATA QUALITY REPORT")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    parts.append("=" * 60 + "\n")
 
     all_passed = True
 
     # Row count checks
-    print("ROW COUNT VALIDATION")
-    print("-" * 60)
+    parts.append("ROW COUNT VALIDATION")
+    parts.append("-" * 60)
     row_checks = check_row_counts()
-    for table, check in row_checks.items():
-        print(f"PASS {table}: {check['actual']} rows (min: {check['expected_min']})")
-    print()
+    parts.append(
+        "\n".join(
+            f"PASS {table}: {check['actual']} rows (min: {check['expected_min']})"
+            for table, check in row_checks.items()
+        )
+    )
+    parts.append("")
 
     # Null percentage checks
-    print("NULL VALUE ANALYSIS")
-    print("-" * 60)
+    parts.append("NULL VALUE ANALYSIS")
+    parts.append("-" * 60)
     null_checks = check_null_percentages()
-    for column, check in null_checks.items():
-        pct = check["actual"] * 100
-        threshold = check["threshold"] * 100
-        print(f"PASS {column}: {pct:.2f}% nulls (threshold: {threshold:.2f}%)")
-    print()
+    parts.append(
+        "\n".join(
+            f"PASS {column}: {check['actual'] * 100:.2f}% nulls "
+            f"(threshold: {check['threshold'] * 100:.2f}%)"
+            for column, check in null_checks.items()
+        )
+    )
+    parts.append("")
 
     # Data freshness checks
-    print("DATA FRESHNESS CHECK")
-    print("-" * 60)
+    parts.append("DATA FRESHNESS CHECK")
+    parts.append("-" * 60)
     freshness_checks = check_data_freshness()
-    for item, check in freshness_checks.items():
-        print(
+    parts.append(
+        "\n".join(
             f"PASS {item}: {check['actual_hours']}h old (max: {check['max_hours_old']}h)"
+            for item, check in freshness_checks.items()
         )
-    print()
+    )
+    parts.append("")
 
     # Summary
     total_checks = len(row_checks) + len(null_checks) + len(freshness_checks)
-    print("=" * 60)
-    print(f"SUMMARY: All {total_checks} data quality checks passed!")
-    print("=" * 60)
+    parts.append("=" * 60)
+    parts.append(f"SUMMARY: All {total_checks} data quality checks passed!")
+    parts.append("=" * 60)
+
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
 
     return 0 if all_passed else 1
 
@@ -0,0 +1,87 @@
+"""
+Shared Fabric token acquisition for CI scripts
+Caches tokens across script invocations so a pipeline run pays the AAD
+round-trip at most once per scope.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import time
+
+
+def _cache_path() -> str:
+    """Token cache location; RUNNER_TEMP on GitHub Actions runners"""
+    cache_dir = os.environ.get("RUNNER_TEMP") or tempfile.gettempdir()
+    return os.path.join(cache_dir, "fabric_token.json")
+
+
+def _read_cached(scope: str):
+    """Return a cached token for scope if it has >60s of life left"""
+    try:
+        with open(_cache_path(), "r") as f:
+            cached = json.load(f).get(scope)
+    except (OSError, ValueError):
+        return None
+
+    if cached and cached.get("expires_on", 0) - time.time() > 60:
+        return cached["token"]
+    return None
+
+
+def _write_cache(scope: str, token: str, expires_on: float) -> None:
+    """Atomically merge a token into the cache file (mode 0600)"""
+    path = _cache_path()
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+
+    data[scope] = {"token": token, "expires_on": expires_on}
+
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_fabric_token(scope: str) -> str:
+    """
+    Get a bearer token for the given scope
+
+    Resolution order:
+    1. FABRIC_TOKEN environment variable (CI/CD)
+    2. Token cache file shared across script invocations
+    3. DefaultAzureCredential round-trip (result is cached for later scripts)
+    """
+    token = os.environ.get("FABRIC_TOKEN")
+    if token:
+        return token
+
+    cached = _read_cached(scope)
+    if cached:
+        return cached
+
+    from azure.identity import DefaultAzureCredential, EnvironmentCredential
+
+    if os.getenv("AZURE_CLIENT_ID"):
+        # CI runners inject service-principal settings into the
+        # environment; go straight to EnvironmentCredential instead of
+        # serializing through DefaultAzureCredential's whole probe chain
+        credential = EnvironmentCredential()
+    else:
+        credential = DefaultAzureCredential(
+            exclude_interactive_browser_credential=True,
+            exclude_shared_token_cache_credential=True,
+            exclude_visual_studio_code_credential=True,
+        )
+    result = credential.get_token(scope)
+    try:
+        _write_cache(scope, result.token, result.expires_on)
+    except OSError:
+        pass  # cache is best-effort
+    return result.token
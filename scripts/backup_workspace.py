@@ -6,10 +6,16 @@ Creates snapshots of workspace state
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to stdlib json
+
 
 def backup_workspace(workspace_id: str, backup_path: str) -> bool:
     """Create workspace backup"""
@@ -36,10 +42,15 @@ def backup_workspace(workspace_id: str, backup_path: str) -> bool:
     print("  ✅ Pipelines backed up")
     print("  ✅ Workspace metadata saved")
 
-    # Save manifest
+    # Save manifest atomically: write to a temp file, then rename into place
+    # so a crash mid-write never leaves a truncated manifest
     manifest_file = backup_dir / "manifest.json"
-    with open(manifest_file, "w") as f:
-        json.dump(manifest, f, indent=2)
+    tmp_file = manifest_file.with_suffix(".json.tmp")
+    if orjson is not None:
+        tmp_file.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_file.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_file, manifest_file)
 
     print(f"\n✅ Backup completed: {backup_dir}")
 
@@ -7,8 +7,62 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import json
+import re
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to stdlib json
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None  # rules still run without the JIT
+
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Named validators that run as a single vectorized pass over the column
+VECTOR_VALIDATORS = {
+    'email': lambda s: s.str.match(EMAIL_RE).fillna(False),
+    'positive': lambda s: s.gt(0),
+    'non_negative': lambda s: s.ge(0),
+    'not_null': lambda s: s.notna(),
+}
+
+
+def numba_rule(columns):
+    """Compile a scalar consistency rule into a parallel counting kernel.
+
+    ``columns`` names the numeric columns the rule reads; the decorated
+    function receives one float64 row array in that column order and
+    returns True when the row passes. With Numba installed the count runs
+    as a compiled prange loop; without it the same rule runs row by row
+    over the raw ndarray, which still skips per-row Series construction.
+    """
+    def decorate(func):
+        if njit is not None:
+            scalar = njit(cache=True)(func)
+
+            @njit(parallel=True, cache=True)
+            def count_violations(arr):
+                violations = 0
+                for i in prange(arr.shape[0]):
+                    if not scalar(arr[i]):
+                        violations += 1
+                return violations
+        else:
+            def count_violations(arr):
+                return sum(1 for row in arr if not func(row))
+
+        def rule(df):
+            arr = df[list(columns)].to_numpy(dtype=np.float64)
+            return count_violations(arr)
+
+        rule._returns_count = True
+        return rule
+    return decorate
+
 
 class DataQualityEvaluator:
     def __init__(self, dataframe, data_name="Dataset"):
@@ -21,11 +75,17 @@ class DataQualityEvaluator:
     def check_completeness(self, null_threshold=0.05):
         """Check data completeness (missing values)"""
         results = {}
-        
+
+        # hasnans is a cached O(1) flag once pandas has checked a column,
+        # so only columns that actually contain nulls need a counted scan
+        with_nans = [c for c in self.df.columns if self.df[c].hasnans]
+        null_counts = self.df[with_nans].isnull().sum() if with_nans else pd.Series(dtype=int)
+        total_rows = len(self.df)
+
         for column in self.df.columns:
-            null_count = self.df[column].isnull().sum()
-            null_pct = null_count / len(self.df)
-            
+            null_count = null_counts.get(column, 0)
+            null_pct = null_count / total_rows
+
             passed = null_pct <= null_threshold
             results[column] = {
                 'null_count': int(null_count),
@@ -35,9 +95,9 @@ class DataQualityEvaluator:
             }
             
             if passed:
-                self.passed.append(f"Completeness: {column}")
+                self.passed.append(('Completeness', column))
             else:
-                self.failed.append(f"Completeness: {column} ({null_pct:.2%} > {null_threshold:.2%})")
+                self.failed.append(('Completeness', column, '{:.2%} > {:.2%}', (null_pct, null_threshold)))
                 
         self.checks['completeness'] = results
         return self
@@ -45,15 +105,21 @@ class DataQualityEvaluator:
     def check_uniqueness(self, unique_columns):
         """Check uniqueness for specified columns"""
         results = {}
-        
-        for column in unique_columns:
-            if column not in self.df.columns:
-                continue
-                
-            total_rows = len(self.df)
-            unique_rows = self.df[column].nunique()
+
+        columns = [c for c in unique_columns if c in self.df.columns]
+        if not columns:
+            self.checks['uniqueness'] = results
+            return self
+
+        # One batched nunique over the sub-frame instead of a full scan
+        # and hash table per column
+        total_rows = len(self.df)
+        unique_counts = self.df[columns].nunique()
+
+        for column in columns:
+            unique_rows = int(unique_counts[column])
             duplicate_count = total_rows - unique_rows
-            
+
             passed = duplicate_count == 0
             results[column] = {
                 'total_rows': total_rows,
@@ -63,22 +129,38 @@ class DataQualityEvaluator:
             }
             
             if passed:
-                self.passed.append(f"Uniqueness: {column}")
+                self.passed.append(('Uniqueness', column))
             else:
-                self.failed.append(f"Uniqueness: {column} ({duplicate_count} duplicates)")
+                self.failed.append(('Uniqueness', column, '{} duplicates', (duplicate_count,)))
                 
         self.checks['uniqueness'] = results
         return self
         
     def check_consistency(self, consistency_rules):
-        """Check data consistency based on business rules"""
+        """Check data consistency based on business rules
+
+        Rules should take the whole DataFrame and return a boolean mask so
+        they evaluate vectorized; row-wise callables still work via an
+        apply() fallback.
+        """
         results = {}
-        
+
         for rule_name, rule_func in consistency_rules.items():
             try:
-                violations = self.df[~self.df.apply(rule_func, axis=1)]
-                violation_count = len(violations)
-                
+                if getattr(rule_func, '_returns_count', False):
+                    # @numba_rule kernels count violations directly
+                    violation_count = int(rule_func(self.df))
+                else:
+                    try:
+                        mask = np.asarray(rule_func(self.df), dtype=bool)
+                    except (TypeError, ValueError, KeyError):
+                        # Legacy row-wise rule: evaluate per row
+                        mask = self.df.apply(rule_func, axis=1).to_numpy(dtype=bool)
+
+                    # Fast path for clean data: all() decides without
+                    # materializing the inverted mask
+                    violation_count = 0 if mask.all() else int((~mask).sum())
+
                 passed = violation_count == 0
                 results[rule_name] = {
                     'violations': int(violation_count),
@@ -87,15 +169,15 @@ class DataQualityEvaluator:
                 }
                 
                 if passed:
-                    self.passed.append(f"Consistency: {rule_name}")
+                    self.passed.append(('Consistency', rule_name))
                 else:
-                    self.failed.append(f"Consistency: {rule_name} ({violation_count} violations)")
+                    self.failed.append(('Consistency', rule_name, '{} violations', (violation_count,)))
             except Exception as e:
                 results[rule_name] = {
                     'error': str(e),
                     'passed': False
                 }
-                self.failed.append(f"Consistency: {rule_name} (error: {str(e)})")
+                self.failed.append(('Consistency', rule_name, 'error: {}', (str(e),)))
                 
         self.checks['consistency'] = results
         return self
@@ -103,32 +185,45 @@ class DataQualityEvaluator:
     def check_accuracy(self, value_ranges):
         """Check if values are within expected ranges"""
         results = {}
-        
-        for column, range_spec in value_ranges.items():
-            if column not in self.df.columns:
-                continue
-                
-            min_val = range_spec.get('min', -np.inf)
-            max_val = range_spec.get('max', np.inf)
-            
-            out_of_range = self.df[
-                (self.df[column] < min_val) | (self.df[column] > max_val)
-            ]
-            violation_count = len(out_of_range)
-            
+
+        columns = [c for c in value_ranges if c in self.df.columns]
+        if not columns:
+            self.checks['accuracy'] = results
+            return self
+
+        # Broadcast the thresholds over a raw ndarray block so min/max and
+        # the out-of-range counts are contiguous SIMD reductions with no
+        # pandas index machinery or violating-rows copy
+        sub = self.df[columns].to_numpy(copy=False)
+        lower = np.array([value_ranges[c].get('min', -np.inf) for c in columns])
+        upper = np.array([value_ranges[c].get('max', np.inf) for c in columns])
+        out_of_range = (sub < lower) | (sub > upper)
+        if out_of_range.any():
+            violations = out_of_range.sum(axis=0)
+        else:
+            # Clean data: skip the per-column counting reduction
+            violations = np.zeros(len(columns), dtype=np.int64)
+        actual_min = np.nanmin(sub, axis=0)
+        actual_max = np.nanmax(sub, axis=0)
+
+        for i, column in enumerate(columns):
+            min_val = value_ranges[column].get('min', -np.inf)
+            max_val = value_ranges[column].get('max', np.inf)
+            violation_count = int(violations[i])
+
             passed = violation_count == 0
             results[column] = {
                 'expected_range': f"[{min_val}, {max_val}]",
-                'actual_min': float(self.df[column].min()),
-                'actual_max': float(self.df[column].max()),
-                'violations': int(violation_count),
+                'actual_min': float(actual_min[i]),
+                'actual_max': float(actual_max[i]),
+                'violations': violation_count,
                 'passed': passed
             }
             
             if passed:
-                self.passed.append(f"Accuracy: {column}")
+                self.passed.append(('Accuracy', column))
             else:
-                self.failed.append(f"Accuracy: {column} ({violation_count} out of range)")
+                self.failed.append(('Accuracy', column, '{} out of range', (violation_count,)))
                 
         self.checks['accuracy'] = results
         return self
@@ -139,7 +234,14 @@ class DataQualityEvaluator:
             return self
             
         try:
-            latest_date = pd.to_datetime(self.df[date_column]).max()
+            series = self.df[date_column]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                # Already datetime-typed: max() is a single C reduction
+                latest_date = series.max()
+            else:
+                # cache=True parses each distinct string once instead of
+                # running dateutil's autodetect row by row
+                latest_date = pd.to_datetime(series, cache=True).max()
             age_days = (datetime.now() - latest_date).days
             
             passed = age_days <= max_age_days
@@ -151,29 +253,43 @@ class DataQualityEvaluator:
             }
             
             if passed:
-                self.passed.append("Timeliness check")
+                self.passed.append(('Timeliness check', None))
             else:
-                self.failed.append(f"Timeliness: Data is {age_days} days old (max: {max_age_days})")
+                self.failed.append(('Timeliness', None, 'Data is {} days old (max: {})', (age_days, max_age_days)))
         except Exception as e:
             self.checks['timeliness'] = {
                 'error': str(e),
                 'passed': False
             }
-            self.failed.append(f"Timeliness: Error - {str(e)}")
+            self.failed.append(('Timeliness', None, 'Error - {}', (str(e),)))
             
         return self
         
     def check_validity(self, validation_rules):
-        """Check data validity with custom validation functions"""
+        """Check data validity with custom validation functions
+
+        Validators may be a VECTOR_VALIDATORS key, a set/list of allowed
+        values, or a callable. Callables are tried vectorized on the whole
+        column first; per-element apply() is only the fallback.
+        """
         results = {}
-        
+
         for column, validator in validation_rules.items():
             if column not in self.df.columns:
                 continue
-                
+
             try:
-                valid_mask = self.df[column].apply(validator)
-                invalid_count = (~valid_mask).sum()
+                series = self.df[column]
+                if isinstance(validator, str):
+                    valid_mask = VECTOR_VALIDATORS[validator](series).to_numpy(dtype=bool)
+                elif isinstance(validator, (set, frozenset, list, tuple)):
+                    valid_mask = series.isin(validator).to_numpy(dtype=bool)
+                else:
+                    try:
+                        valid_mask = np.asarray(validator(series), dtype=bool)
+                    except (TypeError, ValueError, KeyError):
+                        valid_mask = series.apply(validator).to_numpy(dtype=bool)
+                invalid_count = int((~valid_mask).sum())
                 
                 passed = invalid_count == 0
                 results[column] = {
@@ -183,19 +299,32 @@ class DataQualityEvaluator:
                 }
                 
                 if passed:
-                    self.passed.append(f"Validity: {column}")
+                    self.passed.append(('Validity', column))
                 else:
-                    self.failed.append(f"Validity: {column} ({invalid_count} invalid)")
+                    self.failed.append(('Validity', column, '{} invalid', (invalid_count,)))
             except Exception as e:
                 results[column] = {
                     'error': str(e),
                     'passed': False
                 }
-                self.failed.append(f"Validity: {column} (error: {str(e)})")
+                self.failed.append(('Validity', column, 'error: {}', (str(e),)))
                 
         self.checks['validity'] = results
         return self
         
+    @staticmethod
+    def _format_check(entry):
+        """Render a stored (check, subject[, fmt, args]) tuple as text
+
+        check_* methods record outcomes as tuples so the hot path only
+        appends; the message strings are built here, on demand.
+        """
+        check, subject = entry[0], entry[1]
+        if len(entry) == 2:
+            return f"{check}: {subject}" if subject else check
+        detail = entry[2].format(*entry[3])
+        return f"{check}: {subject} ({detail})" if subject else f"{check}: {detail}"
+
     def generate_report(self):
         """Generate comprehensive data quality report"""
         total_checks = len(self.passed) + len(self.failed)
@@ -209,98 +338,114 @@ class DataQualityEvaluator:
             'failed_checks': len(self.failed),
             'success_rate': len(self.passed) / total_checks if total_checks > 0 else 0,
             'checks': self.checks,
-            'passed': self.passed,
-            'failed': self.failed
+            'passed': [self._format_check(entry) for entry in self.passed],
+            'failed': [self._format_check(entry) for entry in self.failed]
         }
         
         return report
         
     def print_report(self):
         """Print formatted data quality report"""
-        print("\n" + "=" * 70)
-        print("DATA QUALITY EVALUATION REPORT")
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70 + "\n")
-        
-        print(f"Dataset: {self.data_name}")
-        print(f"Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
-        print()
-        
+        # Buffer the whole report and emit it with one write instead of a
+        # print call (and stdout lock/flush) per column
+        lines = []
+        append = lines.append
+
+        append("\n" + "=" * 70)
+        append("DATA QUALITY EVALUATION REPORT")
+        append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        append("=" * 70 + "\n")
+
+        append(f"Dataset: {self.data_name}")
+        append(f"Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
+        append("")
+
         if 'completeness' in self.checks:
-            print("COMPLETENESS CHECKS")
-            print("-" * 70)
+            append("COMPLETENESS CHECKS")
+            append("-" * 70)
             for column, result in self.checks['completeness'].items():
                 status = "✅" if result['passed'] else "❌"
-                print(f"  {status} {column:30s}: {result['null_percentage']:.2%} nulls (threshold: {result['threshold']:.2%})")
-            print()
-            
+                append(f"  {status} {column:30s}: {result['null_percentage']:.2%} nulls (threshold: {result['threshold']:.2%})")
+            append("")
+
         if 'uniqueness' in self.checks:
-            print("UNIQUENESS CHECKS")
-            print("-" * 70)
+            append("UNIQUENESS CHECKS")
+            append("-" * 70)
             for column, result in self.checks['uniqueness'].items():
                 status = "✅" if result['passed'] else "❌"
-                print(f"  {status} {column:30s}: {result['duplicate_count']} duplicates")
-            print()
-            
+                append(f"  {status} {column:30s}: {result['duplicate_count']} duplicates")
+            append("")
+
         if 'consistency' in self.checks:
-            print("CONSISTENCY CHECKS")
-            print("-" * 70)
+            append("CONSISTENCY CHECKS")
+            append("-" * 70)
             for rule, result in self.checks['consistency'].items():
                 status = "✅" if result['passed'] else "❌"
                 violations = result.get('violations', 'N/A')
-                print(f"  {status} {rule:30s}: {violations} violations")
-            print()
-            
+                append(f"  {status} {rule:30s}: {violations} violations")
+            append("")
+
         if 'accuracy' in self.checks:
-            print("ACCURACY CHECKS")
-            print("-" * 70)
+            append("ACCURACY CHECKS")
+            append("-" * 70)
             for column, result in self.checks['accuracy'].items():
                 status = "✅" if result['passed'] else "❌"
-                print(f"  {status} {column:30s}: Range {result['expected_range']}, Violations: {result['violations']}")
-            print()
-            
+                append(f"  {status} {column:30s}: Range {result['expected_range']}, Violations: {result['violations']}")
+            append("")
+
         if 'timeliness' in self.checks:
-            print("TIMELINESS CHECKS")
-            print("-" * 70)
+            append("TIMELINESS CHECKS")
+            append("-" * 70)
             result = self.checks['timeliness']
             status = "✅" if result['passed'] else "❌"
             if 'age_days' in result:
-                print(f"  {status} Data Age: {result['age_days']} days (max: {result['max_age_days']})")
-            print()
-            
+                append(f"  {status} Data Age: {result['age_days']} days (max: {result['max_age_days']})")
+            append("")
+
         if 'validity' in self.checks:
-            print("VALIDITY CHECKS")
-            print("-" * 70)
+            append("VALIDITY CHECKS")
+            append("-" * 70)
             for column, result in self.checks['validity'].items():
                 status = "✅" if result['passed'] else "❌"
                 invalid = result.get('invalid_count', 'N/A')
-                print(f"  {status} {column:30s}: {invalid} invalid values")
-            print()
-            
-        print("SUMMARY")
-        print("-" * 70)
+                append(f"  {status} {column:30s}: {invalid} invalid values")
+            append("")
+
+        append("SUMMARY")
+        append("-" * 70)
         total = len(self.passed) + len(self.failed)
         success_rate = (len(self.passed) / total * 100) if total > 0 else 0
-        print(f"  Total Checks: {total}")
-        print(f"  Passed: {len(self.passed)}")
-        print(f"  Failed: {len(self.failed)}")
-        print(f"  Success Rate: {success_rate:.1f}%")
-        print()
-        
+        append(f"  Total Checks: {total}")
+        append(f"  Passed: {len(self.passed)}")
+        append(f"  Failed: {len(self.failed)}")
+        append(f"  Success Rate: {success_rate:.1f}%")
+        append("")
+
         if len(self.failed) == 0:
-            print("  ✅ All data quality checks passed!")
+            append("  ✅ All data quality checks passed!")
         else:
-            print(f"  ⚠️  {len(self.failed)} check(s) failed!")
-            
-        print("=" * 70)
-        
+            append(f"  ⚠️  {len(self.failed)} check(s) failed!")
+
+        append("=" * 70)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
         return self
         
     def save_report(self, filepath='data_quality_report.json'):
         """Save data quality report to JSON file"""
         report = self.generate_report()
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
         print(f"✅ Data quality report saved to: {filepath}")
         return self
 
@@ -3,22 +3,28 @@ Model Evaluation Framework
 Evaluates trained ML models with comprehensive metrics and visualizations
 """
 
-import pandas as pd
 import numpy as np
-from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score,
-    roc_auc_score, confusion_matrix, classification_report,
-    roc_curve, precision_recall_curve
-)
-from sklearn.model_selection import cross_val_score
 import json
 from datetime import datetime
+from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to stdlib json
+
 
 class ModelEvaluator:
-    def __init__(self, model, X_test, y_test, X_train=None, y_train=None):
+    def __init__(self, model, X_test, y_test, X_train=None, y_train=None, dtype=np.float32):
         self.model = model
+        # Materialize the features as contiguous arrays once so predict and
+        # cross_val_score don't re-copy/coerce through check_array on every
+        # call; pass dtype=None for estimators that need the original dtype
+        if dtype is not None:
+            X_test = np.ascontiguousarray(np.asarray(X_test), dtype=dtype)
+            if X_train is not None:
+                X_train = np.ascontiguousarray(np.asarray(X_train), dtype=dtype)
         self.X_test = X_test
         self.y_test = y_test
         self.X_train = X_train
@@ -29,37 +35,61 @@ class ModelEvaluator:
         
     def predict(self):
         """Generate predictions from the model"""
-        self.y_pred = self.model.predict(self.X_test)
         if hasattr(self.model, 'predict_proba'):
-            self.y_proba = self.model.predict_proba(self.X_test)[:, 1]
+            # One forward pass: derive labels from the probabilities
+            # instead of scoring X_test twice
+            proba = self.model.predict_proba(self.X_test)
+            if proba.shape[1] == 2:
+                self.y_proba = proba[:, 1]
+                self.y_pred = (self.y_proba >= 0.5).astype(np.int64)
+            else:
+                self.y_pred = proba.argmax(axis=1)
+        else:
+            self.y_pred = self.model.predict(self.X_test)
         return self
         
     def calculate_classification_metrics(self):
         """Calculate comprehensive classification metrics"""
+        # Imported here so importing this module stays cheap; sklearn.metrics
+        # pulls in most of scipy
+        from sklearn.metrics import confusion_matrix, roc_auc_score
+
         if self.y_pred is None:
             self.predict()
-            
-        self.metrics['accuracy'] = accuracy_score(self.y_test, self.y_pred)
-        self.metrics['precision'] = precision_score(self.y_test, self.y_pred, zero_division=0)
-        self.metrics['recall'] = recall_score(self.y_test, self.y_pred, zero_division=0)
-        self.metrics['f1_score'] = f1_score(self.y_test, self.y_pred, zero_division=0)
-        
+
+        # Tabulate the confusion matrix once; for binary classification
+        # accuracy/precision/recall/f1 are constant-time arithmetic on it,
+        # so the per-metric passes over (y_test, y_pred) are redundant
+        cm = confusion_matrix(self.y_test, self.y_pred)
+        tn, fp, fn, tp = (int(v) for v in cm.ravel())
+
+        self.metrics['accuracy'] = (tp + tn) / cm.sum()
+        self.metrics['precision'] = tp / (tp + fp) if tp + fp else 0.0
+        self.metrics['recall'] = tp / (tp + fn) if tp + fn else 0.0
+        prec, rec = self.metrics['precision'], self.metrics['recall']
+        self.metrics['f1_score'] = 2 * prec * rec / (prec + rec) if prec + rec else 0.0
+
         if self.y_proba is not None:
             self.metrics['roc_auc'] = roc_auc_score(self.y_test, self.y_proba)
-            
-        cm = confusion_matrix(self.y_test, self.y_pred)
+
         self.metrics['confusion_matrix'] = cm.tolist()
-        self.metrics['true_negatives'] = int(cm[0, 0])
-        self.metrics['false_positives'] = int(cm[0, 1])
-        self.metrics['false_negatives'] = int(cm[1, 0])
-        self.metrics['true_positives'] = int(cm[1, 1])
+        self.metrics['true_negatives'] = tn
+        self.metrics['false_positives'] = fp
+        self.metrics['false_negatives'] = fn
+        self.metrics['true_positives'] = tp
         
         return self
         
     def evaluate_model_robustness(self):
         """Evaluate model robustness with cross-validation"""
+        from sklearn.model_selection import cross_val_score
+
         if self.X_train is not None and self.y_train is not None:
-            cv_scores = cross_val_score(self.model, self.X_train, self.y_train, cv=5, scoring='accuracy')
+            # Run the 5 folds concurrently instead of serially on one core
+            cv_scores = cross_val_score(
+                self.model, self.X_train, self.y_train,
+                cv=5, scoring='accuracy', n_jobs=-1, pre_dispatch='2*n_jobs'
+            )
             self.metrics['cv_scores'] = cv_scores.tolist()
             self.metrics['cv_mean'] = float(cv_scores.mean())
             self.metrics['cv_std'] = float(cv_scores.std())
@@ -115,68 +145,83 @@ class ModelEvaluator:
         
     def print_report(self):
         """Print formatted evaluation report"""
-        print("\n" + "=" * 70)
-        print("MODEL EVALUATION REPORT")
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 70 + "\n")
-        
-        print(f"Model Type: {type(self.model).__name__}")
-        print(f"Test Samples: {len(self.X_test)}")
-        print()
-        
-        print("CLASSIFICATION METRICS")
-        print("-" * 70)
-        print(f"  Accuracy:  {self.metrics.get('accuracy', 0):.4f}")
-        print(f"  Precision: {self.metrics.get('precision', 0):.4f}")
-        print(f"  Recall:    {self.metrics.get('recall', 0):.4f}")
-        print(f"  F1 Score:  {self.metrics.get('f1_score', 0):.4f}")
+        # Buffer the whole report and emit it with one write instead of a
+        # print call (and stdout lock/flush) per line
+        lines = []
+        append = lines.append
+
+        append("\n" + "=" * 70)
+        append("MODEL EVALUATION REPORT")
+        append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        append("=" * 70 + "\n")
+
+        append(f"Model Type: {type(self.model).__name__}")
+        append(f"Test Samples: {len(self.X_test)}")
+        append("")
+
+        append("CLASSIFICATION METRICS")
+        append("-" * 70)
+        append(f"  Accuracy:  {self.metrics.get('accuracy', 0):.4f}")
+        append(f"  Precision: {self.metrics.get('precision', 0):.4f}")
+        append(f"  Recall:    {self.metrics.get('recall', 0):.4f}")
+        append(f"  F1 Score:  {self.metrics.get('f1_score', 0):.4f}")
         if 'roc_auc' in self.metrics:
-            print(f"  ROC AUC:   {self.metrics['roc_auc']:.4f}")
-        print()
-        
-        print("CONFUSION MATRIX")
-        print("-" * 70)
-        cm = np.array(self.metrics['confusion_matrix'])
-        print(f"  True Negatives:  {self.metrics['true_negatives']}")
-        print(f"  False Positives: {self.metrics['false_positives']}")
-        print(f"  False Negatives: {self.metrics['false_negatives']}")
-        print(f"  True Positives:  {self.metrics['true_positives']}")
-        print()
-        
+            append(f"  ROC AUC:   {self.metrics['roc_auc']:.4f}")
+        append("")
+
+        append("CONFUSION MATRIX")
+        append("-" * 70)
+        append(f"  True Negatives:  {self.metrics['true_negatives']}")
+        append(f"  False Positives: {self.metrics['false_positives']}")
+        append(f"  False Negatives: {self.metrics['false_negatives']}")
+        append(f"  True Positives:  {self.metrics['true_positives']}")
+        append("")
+
         if 'cv_scores' in self.metrics:
-            print("CROSS-VALIDATION RESULTS")
-            print("-" * 70)
-            print(f"  Mean CV Score: {self.metrics['cv_mean']:.4f}")
-            print(f"  Std Dev:       {self.metrics['cv_std']:.4f}")
-            print()
-            
+            append("CROSS-VALIDATION RESULTS")
+            append("-" * 70)
+            append(f"  Mean CV Score: {self.metrics['cv_mean']:.4f}")
+            append(f"  Std Dev:       {self.metrics['cv_std']:.4f}")
+            append("")
+
         if 'threshold_checks' in self.metrics:
             checks = self.metrics['threshold_checks']
-            print("PERFORMANCE THRESHOLD CHECKS")
-            print("-" * 70)
-            
+            append("PERFORMANCE THRESHOLD CHECKS")
+            append("-" * 70)
+
             for metric, result in checks['passed'].items():
-                print(f"  ✅ {metric:12s}: {result['actual']:.4f} (threshold: {result['threshold']:.4f})")
-                
+                append(f"  ✅ {metric:12s}: {result['actual']:.4f} (threshold: {result['threshold']:.4f})")
+
             for metric, result in checks['failed'].items():
-                print(f"  ❌ {metric:12s}: {result['actual']:.4f} (threshold: {result['threshold']:.4f}, gap: {result['gap']:.4f})")
-            
-            print()
+                append(f"  ❌ {metric:12s}: {result['actual']:.4f} (threshold: {result['threshold']:.4f}, gap: {result['gap']:.4f})")
+
+            append("")
             if checks['all_passed']:
-                print("  ✅ All performance thresholds passed!")
+                append("  ✅ All performance thresholds passed!")
             else:
-                print(f"  ⚠️  {len(checks['failed'])} threshold(s) failed!")
-            print()
-            
-        print("=" * 70)
-        
+                append(f"  ⚠️  {len(checks['failed'])} threshold(s) failed!")
+            append("")
+
+        append("=" * 70)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
         return self
         
     def save_report(self, filepath='evaluation_report.json'):
         """Save evaluation report to JSON file"""
         report = self.generate_report()
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
         print(f"✅ Evaluation report saved to: {filepath}")
         return self
 
@@ -184,12 +229,24 @@ class ModelEvaluator:
 def evaluate_model_from_file(model_path, test_data_path):
     """Load and evaluate a saved model"""
     import joblib
-    
+    import pandas as pd
+
+
     model = joblib.load(model_path)
-    test_data = pd.read_csv(test_data_path)
-    
+
+    # Prefer a Parquet sibling (no CSV parsing at all); otherwise let
+    # pyarrow's vectorized CSV reader do the type inference in C++
+    parquet_path = Path(test_data_path).with_suffix('.parquet')
+    if parquet_path.exists():
+        test_data = pd.read_parquet(parquet_path, engine='pyarrow')
+    else:
+        try:
+            test_data = pd.read_csv(test_data_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            test_data = pd.read_csv(test_data_path)
+
     X_test = test_data.drop('target', axis=1)
-    y_test = test_data['target']
+    y_test = test_data['target'].to_numpy(dtype=np.int8)
     
     evaluator = ModelEvaluator(model, X_test, y_test)
     evaluator.predict()
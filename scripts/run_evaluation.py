@@ -3,22 +3,66 @@ Run Complete Evaluation Suite
 Executes all evaluation checks for the workspace
 """
 
-import pandas as pd
-import numpy as np
 from datetime import datetime
+from pathlib import Path
+import functools
 import sys
 import os
 
+BANNER = "=" * 70
+DIVIDER = "-" * 70
+
+# Only the columns the evaluation reads, with explicit narrow dtypes so
+# pandas skips type inference and boxes nothing through Python objects
+SAMPLE_COLUMNS = {
+    'customer_id': 'int64',
+    'total_purchases': 'int32',
+    'avg_purchase_value': 'float32',
+    'days_since_last_purchase': 'int32',
+    'customer_age_days': 'int32',
+    'support_tickets': 'int16',
+    'churn': 'int8',
+}
+
+
+def _read_sample_csv(path):
+    """Read the sample CSV with explicit columns and dtypes"""
+    import pandas as pd
+
+    return pd.read_csv(path, usecols=list(SAMPLE_COLUMNS), dtype=SAMPLE_COLUMNS)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sample_data(path='sample_customer_data.csv'):
+    """Load the sample dataset, keeping a Parquet copy next to the CSV
+
+    Parquet loads columnar with dtypes preserved, several times faster
+    than re-parsing the CSV; the copy is refreshed whenever the CSV is
+    newer. The lru_cache makes repeat loads in one process free. pandas
+    is imported here, not at module top, so the script starts instantly
+    when no data work happens.
+    """
+    import pandas as pd
+
+    parquet_path = Path(path).with_suffix('.parquet')
+    try:
+        if not parquet_path.exists() or parquet_path.stat().st_mtime < Path(path).stat().st_mtime:
+            _read_sample_csv(path).to_parquet(parquet_path)
+        return pd.read_parquet(parquet_path)
+    except ImportError:
+        # No parquet engine installed: read the CSV directly
+        return _read_sample_csv(path)
+
 
 def evaluate_sample_data():
     """Evaluate sample customer data quality"""
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("EVALUATING SAMPLE CUSTOMER DATA")
-    print("=" * 70)
+    print(BANNER)
     
     try:
-        df = pd.read_csv('sample_customer_data.csv')
-        
+        df = _load_sample_data()
+
         from evaluate_data_quality import DataQualityEvaluator
         
         evaluator = DataQualityEvaluator(df, 'Customer Churn Dataset')
@@ -27,12 +71,14 @@ def evaluate_sample_data():
         
         evaluator.check_uniqueness(['customer_id'])
         
+        # Whole-frame rules: each evaluates as one vectorized column
+        # comparison instead of a Python call per row
         consistency_rules = {
-            'total_purchases_positive': lambda row: row['total_purchases'] >= 0,
-            'avg_purchase_positive': lambda row: row['avg_purchase_value'] >= 0,
-            'days_positive': lambda row: row['days_since_last_purchase'] >= 0,
-            'age_positive': lambda row: row['customer_age_days'] >= 0,
-            'churn_binary': lambda row: row['churn'] in [0, 1]
+            'total_purchases_positive': lambda df: df['total_purchases'] >= 0,
+            'avg_purchase_positive': lambda df: df['avg_purchase_value'] >= 0,
+            'days_positive': lambda df: df['days_since_last_purchase'] >= 0,
+            'age_positive': lambda df: df['customer_age_days'] >= 0,
+            'churn_binary': lambda df: df['churn'].isin([0, 1])
         }
         evaluator.check_consistency(consistency_rules)
         
@@ -58,9 +104,9 @@ def evaluate_sample_data():
 
 def run_model_benchmarks():
     """Run model performance benchmarks"""
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("MODEL PERFORMANCE BENCHMARKS")
-    print("=" * 70)
+    print(BANNER)
     
     benchmarks = {
         'baseline_accuracy': 0.50,
@@ -74,7 +120,7 @@ def run_model_benchmarks():
     }
     
     print("\nMINIMUM PERFORMANCE THRESHOLDS:")
-    print("-" * 70)
+    print(DIVIDER)
     print(f"  Accuracy:  {benchmarks['target_accuracy']:.2%}")
     print(f"  Precision: {benchmarks['target_precision']:.2%}")
     print(f"  Recall:    {benchmarks['target_recall']:.2%}")
@@ -86,29 +132,27 @@ def run_model_benchmarks():
 
 def validate_pipeline_outputs():
     """Validate that pipeline outputs meet requirements"""
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("PIPELINE OUTPUT VALIDATION")
-    print("=" * 70)
+    print(BANNER)
     
-    checks = []
-    
-    if os.path.exists('sample_customer_data.csv'):
-        checks.append(('Sample data file exists', True))
-    else:
-        checks.append(('Sample data file exists', False))
-        
-    if os.path.exists('notebooks/model_training.ipynb') or os.path.exists('notebooks/model_training.Notebook'):
-        checks.append(('Model training notebook exists', True))
+    # One directory scan per location instead of a stat() syscall per
+    # artifact; membership tests then come from in-memory sets
+    present_root = {entry.name for entry in os.scandir('.') if entry.is_file()}
+    if os.path.isdir('notebooks'):
+        present_notebooks = {entry.name for entry in os.scandir('notebooks')}
     else:
-        checks.append(('Model training notebook exists', False))
-        
-    if os.path.exists('check_data_quality.py'):
-        checks.append(('Data quality script exists', True))
-    else:
-        checks.append(('Data quality script exists', False))
-        
+        present_notebooks = set()
+
+    checks = [
+        ('Sample data file exists', 'sample_customer_data.csv' in present_root),
+        ('Model training notebook exists',
+         bool({'model_training.ipynb', 'model_training.Notebook'} & present_notebooks)),
+        ('Data quality script exists', 'check_data_quality.py' in present_root),
+    ]
+
     print("\nPIPELINE ARTIFACT CHECKS:")
-    print("-" * 70)
+    print(DIVIDER)
     for check_name, passed in checks:
         status = "✅" if passed else "❌"
         print(f"  {status} {check_name}")
@@ -126,13 +170,17 @@ def validate_pipeline_outputs():
 
 def generate_evaluation_summary():
     """Generate overall evaluation summary"""
-    print("\n" + "=" * 70)
+    # One timestamp for both the banner and the stored summary, so the
+    # printed and recorded values can never disagree
+    now = datetime.now()
+
+    print("\n" + BANNER)
     print("EVALUATION SUMMARY")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
-    
+    print(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(BANNER)
+
     summary = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'evaluation_components': [
             'Data Quality Assessment',
             'Model Performance Benchmarks',
@@ -145,20 +193,25 @@ def generate_evaluation_summary():
     for component in summary['evaluation_components']:
         print(f"  ✅ {component}")
     
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("✅ EVALUATION FRAMEWORK COMPLETED SUCCESSFULLY")
-    print("=" * 70 + "\n")
+    print(BANNER + "\n")
     
     return summary
 
 
 def main():
     """Run complete evaluation suite"""
+    # Block-buffer stdout so the banner-heavy output coalesces into a few
+    # writes instead of one syscall per print under CI
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     os.makedirs('reports', exist_ok=True)
     
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("NVR WORKSPACE EVALUATION FRAMEWORK")
-    print("=" * 70)
+    print(BANNER)
     
     data_quality = evaluate_sample_data()
     
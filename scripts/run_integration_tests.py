@@ -5,15 +5,19 @@ Tests end-to-end workflows after deployment
 """
 
 import argparse
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+BANNER = "=" * 70
 
 
 def run_integration_tests(workspace_id: str, environment: str) -> bool:
     """Run integration tests"""
-    print("=" * 70)
+    print(BANNER)
     print("🧪 INTEGRATION TESTS")
-    print("=" * 70)
+    print(BANNER)
     print(f"Workspace ID: {workspace_id}")
     print(f"Environment: {environment}")
     print()
@@ -24,38 +28,40 @@ def run_integration_tests(workspace_id: str, environment: str) -> bool:
         ("End-to-End Flow", test_e2e_flow),
     ]
 
-    all_passed = True
-    for test_name, test_func in tests:
-        print(f"\n{'─' * 70}")
-        print(f"🧪 Running: {test_name}")
-        print(f"{'─' * 70}")
-
-        if test_func(workspace_id, environment):
-            print(f"✅ {test_name} PASSED")
-        else:
-            print(f"❌ {test_name} FAILED")
-            all_passed = False
-
-        time.sleep(1)
-
-    print("\n" + "=" * 70)
-    print("📊 TEST RESULTS")
-    print("=" * 70)
-
-    for test_name, test_func in tests:
-        # This is a simplified summary - in real implementation, store results
-        print(f"{test_name:30s} ✅ PASSED")
-
-    print("=" * 70)
-
-    return all_passed
+    # The tests are independent and IO-bound (API waits in production),
+    # so run them concurrently and report each one as it finishes
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            executor.submit(test_func, workspace_id, environment): test_name
+            for test_name, test_func in tests
+        }
+        for future in as_completed(futures):
+            test_name = futures[future]
+            results[test_name] = future.result()
+            if results[test_name]:
+                print(f"✅ {test_name} PASSED")
+            else:
+                print(f"❌ {test_name} FAILED")
+
+    # Build the summary from the recorded results and emit it with a
+    # single write
+    lines = ["\n" + BANNER, "📊 TEST RESULTS", BANNER]
+    for test_name, _ in tests:
+        status = "✅ PASSED" if results[test_name] else "❌ FAILED"
+        lines.append(f"{test_name:30s} {status}")
+    lines.append(BANNER)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return all(results.values())
 
 
 def test_notebook_execution(workspace_id: str, environment: str) -> bool:
     """Test notebook can execute successfully"""
     print("  📓 Testing notebook execution...")
-    print("  ⏳ Simulating notebook run...")
-    time.sleep(2)
+    if os.environ.get("SIMULATE_DELAYS"):
+        print("  ⏳ Simulating notebook run...")
+        time.sleep(2)
 
     # In production, this would:
     # 1. Trigger notebook execution via Fabric API
@@ -70,8 +76,9 @@ def test_notebook_execution(workspace_id: str, environment: str) -> bool:
 def test_data_pipeline(workspace_id: str, environment: str) -> bool:
     """Test data pipeline execution"""
     print("  🔄 Testing data pipeline...")
-    print("  ⏳ Simulating pipeline run...")
-    time.sleep(2)
+    if os.environ.get("SIMULATE_DELAYS"):
+        print("  ⏳ Simulating pipeline run...")
+        time.sleep(2)
 
     # In production, this would:
     # 1. Trigger pipeline via Fabric API
@@ -86,8 +93,9 @@ def test_data_pipeline(workspace_id: str, environment: str) -> bool:
 def test_e2e_flow(workspace_id: str, environment: str) -> bool:
     """Test end-to-end workflow"""
     print("  🔗 Testing end-to-end flow...")
-    print("  ⏳ Running full workflow...")
-    time.sleep(2)
+    if os.environ.get("SIMULATE_DELAYS"):
+        print("  ⏳ Running full workflow...")
+        time.sleep(2)
 
     # In production, this would:
     # 1. Execute complete workflow
@@ -101,6 +109,11 @@ def test_e2e_flow(workspace_id: str, environment: str) -> bool:
 
 def main():
     """Main entry point"""
+    # Under CI stdout is usually unbuffered; block-buffer it so the many
+    # small prints coalesce into a few writes
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     parser = argparse.ArgumentParser(description="Run Fabric integration tests")
     parser.add_argument("--workspace-id", required=True, help="Fabric workspace ID")
     parser.add_argument(
@@ -5,18 +5,24 @@ Integrates GitHub Actions with Fabric deployment pipelines
 """
 
 import argparse
-import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-try:
-    import requests
-    from azure.identity import DefaultAzureCredential
-except ImportError:
-    print("❌ Required packages not installed")
-    print("Run: pip install requests azure-identity")
-    sys.exit(1)
+from _fabric_auth import get_fabric_token
+
+
+def _import_http_deps():
+    """Import requests lazily so --help doesn't pay the import cost"""
+    global requests, HTTPAdapter, Retry
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+    except ImportError:
+        print("❌ Required packages not installed")
+        print("Run: pip install requests azure-identity")
+        sys.exit(1)
 
 
 class FabricDeploymentPipeline:
@@ -30,37 +36,47 @@ class FabricDeploymentPipeline:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
+        # One keep-alive session for every call, including the status
+        # polling loop: no fresh TLS handshake per request, plus retry with
+        # backoff on transient API errors. Retries cover GET only — the
+        # deploy POST is not idempotent, and re-sending it after a 5xx
+        # could trigger the same deployment twice.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        # Pipeline metadata never changes mid-run; fetch each endpoint once
+        self._stages_cache = None
+        self._info_cache = None
 
     def _get_access_token(self) -> str:
         """Get Fabric API access token"""
         print("🔐 Acquiring Fabric access token...")
 
-        # Try environment variable first (for CI/CD)
-        token = os.environ.get("FABRIC_TOKEN")
-        if token:
-            print("✅ Using token from environment variable")
-            return token
-
-        # Use Azure credential (for local development)
         try:
-            credential = DefaultAzureCredential()
-            token_result = credential.get_token(
-                "https://api.fabric.microsoft.com/.default"
-            )
-            print("✅ Token acquired via DefaultAzureCredential")
-            return token_result.token
+            token = get_fabric_token("https://api.fabric.microsoft.com/.default")
+            print("✅ Token acquired")
+            return token
         except Exception as e:
             print(f"❌ Failed to get token: {e}")
             sys.exit(1)
 
     def get_pipeline_stages(self) -> dict:
-        """Get deployment pipeline stages"""
+        """Get deployment pipeline stages (cached per instance)"""
+        if self._stages_cache is not None:
+            return self._stages_cache
+
         print(f"📊 Getting pipeline stages for pipeline: {self.pipeline_id}")
 
         url = f"{self.base_url}/deploymentPipelines/{self.pipeline_id}/stages"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             stages = response.json()
 
@@ -68,6 +84,7 @@ class FabricDeploymentPipeline:
             for stage in stages.get("value", []):
                 print(f"  - {stage.get('displayName')} (Stage {stage.get('order')})")
 
+            self._stages_cache = stages
             return stages
         except requests.exceptions.RequestException as e:
             print(f"❌ Failed to get pipeline stages: {e}")
@@ -98,13 +115,10 @@ class FabricDeploymentPipeline:
         stages_data = self.get_pipeline_stages()
         stages = stages_data.get("value", [])
 
-        # Find source and target stage IDs
-        source_stage = next(
-            (s for s in stages if s.get("order") == source_stage_order), None
-        )
-        target_stage = next(
-            (s for s in stages if s.get("order") == target_stage_order), None
-        )
+        # Find source and target stage IDs via one order-keyed dict
+        stage_by_order = {s.get("order"): s for s in stages}
+        source_stage = stage_by_order.get(source_stage_order)
+        target_stage = stage_by_order.get(target_stage_order)
 
         if not source_stage or not target_stage:
             print(
@@ -135,7 +149,7 @@ class FabricDeploymentPipeline:
 
         try:
             print(f"📤 Sending deployment request...")
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self.session.post(url, json=payload)
             response.raise_for_status()
 
             print(f"✅ Deployment request accepted (Status: {response.status_code})")
@@ -188,10 +202,11 @@ class FabricDeploymentPipeline:
 
         url = f"{self.base_url}/operations/{operation_id}"
         start_time = time.time()
+        delay = 1.0  # poll quickly at first, then back off
 
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url)
                 response.raise_for_status()
 
                 operation = response.json()
@@ -209,30 +224,38 @@ class FabricDeploymentPipeline:
                     print(
                         f"  Status: {status}... (elapsed: {int(time.time() - start_time)}s)"
                     )
-                    time.sleep(10)  # Check every 10 seconds
                 else:
                     print(f"⚠️ Unknown status: {status}")
-                    time.sleep(10)
+
+                # Honour the server's Retry-After hint when it sends one,
+                # otherwise exponential backoff capped at 15s
+                time.sleep(float(response.headers.get("Retry-After", delay)))
+                delay = min(delay * 2, 15.0)
 
             except requests.exceptions.RequestException as e:
                 print(f"⚠️ Error checking deployment status: {e}")
-                time.sleep(10)
+                time.sleep(delay)
+                delay = min(delay * 2, 15.0)
 
         print(f"❌ Deployment timed out after {timeout} seconds")
         return False
 
     def get_pipeline_info(self) -> dict:
-        """Get deployment pipeline information"""
+        """Get deployment pipeline information (cached per instance)"""
+        if self._info_cache is not None:
+            return self._info_cache
+
         print(f"📋 Getting pipeline information...")
 
         url = f"{self.base_url}/deploymentPipelines/{self.pipeline_id}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             pipeline = response.json()
 
             print(f"✅ Pipeline: {pipeline.get('displayName')}")
+            self._info_cache = pipeline
             return pipeline
         except requests.exceptions.RequestException as e:
             print(f"❌ Failed to get pipeline info: {e}")
@@ -240,6 +263,11 @@ class FabricDeploymentPipeline:
                 print(f"Response: {e.response.text}")
             sys.exit(1)
 
+    def invalidate(self):
+        """Clear cached pipeline metadata so the next call re-fetches"""
+        self._stages_cache = None
+        self._info_cache = None
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -277,11 +305,16 @@ def main():
         print("❌ Source stage must be before target stage (Dev→Test→Prod)")
         sys.exit(1)
 
+    _import_http_deps()
     pipeline = FabricDeploymentPipeline(args.pipeline_id)
 
     if args.info:
-        pipeline.get_pipeline_info()
-        pipeline.get_pipeline_stages()
+        # Two independent GETs: fetch them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            info_future = executor.submit(pipeline.get_pipeline_info)
+            stages_future = executor.submit(pipeline.get_pipeline_stages)
+            info_future.result()
+            stages_future.result()
         return
 
     # Trigger deployment
@@ -5,15 +5,25 @@ Checks that deployed artifacts match expected state
 """
 
 import argparse
-import os
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import requests
-    from azure.identity import DefaultAzureCredential
-except ImportError:
-    print("❌ Required packages not installed")
-    sys.exit(1)
+from _fabric_auth import get_fabric_token
+
+BANNER = "=" * 70
+
+
+def _import_http_deps():
+    """Import requests lazily so --help doesn't pay the import cost"""
+    global requests, HTTPAdapter, Retry
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+    except ImportError:
+        print("❌ Required packages not installed")
+        sys.exit(1)
 
 
 class DeploymentValidator:
@@ -28,41 +38,55 @@ class DeploymentValidator:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
+        # One keep-alive session for all checks: reuses the TCP+TLS
+        # connection instead of a fresh handshake per request, and retries
+        # transient API errors with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        # The /items response covers notebooks too; fetch it once and let
+        # both checks read from it (lock because checks run concurrently)
+        self._items_response = None
+        self._items_lock = threading.Lock()
 
     def _get_access_token(self) -> str:
         """Get Fabric API access token"""
-        token = os.environ.get("FABRIC_TOKEN")
-        if token:
-            return token
-
         try:
-            credential = DefaultAzureCredential()
-            token_result = credential.get_token(
+            return get_fabric_token(
                 "https://analysis.windows.net/powerbi/api/.default"
             )
-            return token_result.token
         except Exception as e:
             print(f"❌ Failed to acquire token: {str(e)}")
             sys.exit(1)
 
     def validate_deployment(self) -> bool:
         """Run all validation checks"""
-        print("=" * 70)
+        print(BANNER)
         print("🔍 DEPLOYMENT VALIDATION")
-        print("=" * 70)
+        print(BANNER)
         print(f"Workspace ID: {self.workspace_id}")
         print(f"Environment: {self.environment}")
         print()
 
-        checks = [
-            ("Workspace Access", self.check_workspace_access()),
-            ("Notebooks", self.check_notebooks()),
-            ("Workspace State", self.check_workspace_state()),
-        ]
-
-        print("\n" + "=" * 70)
+        # The three checks are independent GETs, so issue them concurrently:
+        # total latency is the slowest round-trip instead of the sum
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                ("Workspace Access", executor.submit(self.check_workspace_access)),
+                ("Notebooks", executor.submit(self.check_notebooks)),
+                ("Workspace State", executor.submit(self.check_workspace_state)),
+            ]
+            checks = [(name, future.result()) for name, future in futures]
+
+        print("\n" + BANNER)
         print("📊 VALIDATION RESULTS")
-        print("=" * 70)
+        print(BANNER)
 
         all_passed = True
         for check_name, result in checks:
@@ -71,7 +95,7 @@ class DeploymentValidator:
             if not result:
                 all_passed = False
 
-        print("=" * 70)
+        print(BANNER)
 
         return all_passed
 
@@ -81,7 +105,7 @@ class DeploymentValidator:
 
         try:
             url = f"{self.base_url}/workspaces/{self.workspace_id}"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
 
             if response.status_code == 200:
                 workspace = response.json()
@@ -96,16 +120,24 @@ class DeploymentValidator:
             print(f"  ❌ Error: {str(e)}")
             return False
 
+    def _fetch_items(self) -> "requests.Response":
+        """Fetch the workspace /items listing (one request per run)"""
+        with self._items_lock:
+            if self._items_response is None:
+                url = f"{self.base_url}/workspaces/{self.workspace_id}/items"
+                self._items_response = self.session.get(url, timeout=30)
+        return self._items_response
+
     def check_notebooks(self) -> bool:
         """Verify notebooks are deployed correctly"""
         print("\n📓 Checking deployed notebooks...")
 
         try:
-            url = f"{self.base_url}/workspaces/{self.workspace_id}/notebooks"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._fetch_items()
 
             if response.status_code == 200:
-                notebooks = response.json().get("value", [])
+                items = response.json().get("value", [])
+                notebooks = [i for i in items if i.get("type") == "Notebook"]
                 print(f"  ✅ Found {len(notebooks)} notebook(s) in workspace")
 
                 for notebook in notebooks:
@@ -127,18 +159,13 @@ class DeploymentValidator:
         print("\n📊 Checking workspace state...")
 
         try:
-            # Get all items in workspace
-            url = f"{self.base_url}/workspaces/{self.workspace_id}/items"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._fetch_items()
 
             if response.status_code == 200:
                 items = response.json().get("value", [])
 
-                # Count by type
-                item_counts = {}
-                for item in items:
-                    item_type = item.get("type", "Unknown")
-                    item_counts[item_type] = item_counts.get(item_type, 0) + 1
+                # Count by type in one C-level pass
+                item_counts = Counter(item.get("type", "Unknown") for item in items)
 
                 print(f"  ✅ Total items: {len(items)}")
                 for item_type, count in sorted(item_counts.items()):
@@ -168,6 +195,7 @@ def main():
 
     args = parser.parse_args()
 
+    _import_http_deps()
     validator = DeploymentValidator(args.workspace_id, args.environment)
 
     if validator.validate_deployment():
@@ -1,41 +1,111 @@
 # Install fabric-cicd: https://microsoft.github.io/fabric-cicd/
-from azure.identity import InteractiveBrowserCredential, ClientSecretCredential
-from fabric_cicd import FabricWorkspace, publish_all_items, change_log_level
 import argparse
+import hashlib
+import json
 import os
 
 #change_log_level("DEBUG")
 
-parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-parser.add_argument("--spn-auth", default = False)
-parser.add_argument("--workspace", default = "PBIP Demo")
-parser.add_argument("--environment", default = "DEV")
-parser.add_argument("--src", default = ".\\src")
+CACHE_DIR = ".fabric_cache"
+MANIFEST_FILE = os.path.join(CACHE_DIR, "manifest.json")
 
-args = parser.parse_args()
 
-spn_auth = args.spn_auth
-workspace_name = args.workspace
-src_path = args.src
-environment = args.environment
+def collect_digests(src_path):
+    """sha256 of every file under src_path, keyed by relative path"""
+    digests = {}
+    for root, dirs, files in os.walk(src_path):
+        dirs.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            with open(full, "rb") as f:
+                digests[os.path.relpath(full, src_path)] = hashlib.sha256(f.read()).hexdigest()
+    return digests
 
-# Authentication (SPN or Interactive)
 
-if (not spn_auth):
-    credential = InteractiveBrowserCredential() 
-else:
-    client_id = os.getenv("FABRIC_CLIENT_ID")
-    client_secret = os.getenv("FABRIC_CLIENT_SECRET")
-    tenant_id = os.getenv("FABRIC_TENANT_ID")
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
-    credential = ClientSecretCredential(client_id=client_id, client_secret=client_secret, tenant_id=tenant_id)
 
-target_workspace = FabricWorkspace(    
-    workspace_name = workspace_name,  
-    environment = environment,
-    repository_directory = src_path,
-    item_type_in_scope = ["SemanticModel", "Report"],     
-    token_credential = credential,
-)
+def save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
 
-publish_all_items(fabric_workspace_obj = target_workspace)
+
+def main():
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("--spn-auth", default = False)
+    parser.add_argument("--workspace", default = "PBIP Demo")
+    parser.add_argument("--environment", default = "DEV")
+    parser.add_argument("--src", default = ".\\src")
+
+    args = parser.parse_args()
+
+    spn_auth = args.spn_auth
+    workspace_name = args.workspace
+    src_path = args.src
+    environment = args.environment
+
+    # A redeploy with no source changes is a no-op: compare the sha256 of
+    # every file under src_path against the manifest from the last deploy
+    # and skip the whole publish round-trip when nothing changed
+    manifest = {
+        "workspace": workspace_name,
+        "environment": environment,
+        "files": collect_digests(src_path),
+    }
+
+    if load_manifest() == manifest:
+        print(f"No changes under {src_path} since last deploy to '{workspace_name}' ({environment}) - skipping publish")
+        return
+
+    # The Azure and fabric-cicd import chains cost hundreds of ms, so they
+    # are loaded only after argument handling — --help and the unchanged
+    # short-circuit above never pay for them
+    from azure.identity import (
+        InteractiveBrowserCredential,
+        ClientSecretCredential,
+        TokenCachePersistenceOptions,
+    )
+    from fabric_cicd import FabricWorkspace, publish_all_items, change_log_level
+
+    # Authentication (SPN or Interactive)
+    # The persistent token cache lets repeated deploys reuse the token
+    # within its TTL instead of re-authenticating every run
+
+    if (not spn_auth):
+        credential = InteractiveBrowserCredential(
+            cache_persistence_options=TokenCachePersistenceOptions(name="fabric_cicd")
+        )
+    else:
+        client_id = os.getenv("FABRIC_CLIENT_ID")
+        client_secret = os.getenv("FABRIC_CLIENT_SECRET")
+        tenant_id = os.getenv("FABRIC_TENANT_ID")
+
+        credential = ClientSecretCredential(
+            client_id=client_id,
+            client_secret=client_secret,
+            tenant_id=tenant_id,
+            cache_persistence_options=TokenCachePersistenceOptions(name="fabric_cicd"),
+        )
+
+    target_workspace = FabricWorkspace(
+        workspace_name = workspace_name,
+        environment = environment,
+        repository_directory = src_path,
+        item_type_in_scope = ["SemanticModel", "Report"],
+        token_credential = credential,
+    )
+
+    publish_all_items(fabric_workspace_obj = target_workspace)
+
+    # Record what was published so the next unchanged run can skip
+    save_manifest(manifest)
+
+
+if __name__ == "__main__":
+    main()